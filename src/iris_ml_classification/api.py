@@ -1,6 +1,8 @@
 """api module."""
 
 import os
+import time
+from collections.abc import Callable
 from typing import Any
 
 import pandas as pd
@@ -14,6 +16,7 @@ def get_databricks_token(
     client_secret: str = None,
     grant_type: str = "client_credentials",
     scope: str = "all-apis",
+    timeout: float | None = None,
 ) -> str:
     """Retrieve an OAuth access token from a Databricks host using client credentials.
 
@@ -24,6 +27,7 @@ def get_databricks_token(
     :param client_secret: The OAuth client secret. If not provided, uses the DATABRICKS_CLIENT_SECRET environment variable.
     :param grant_type: The OAuth grant type, defaulting to "client_credentials".
     :param scope: The OAuth scope, defaulting to "all-apis".
+    :param timeout: Seconds to wait for the token endpoint before giving up (default: no timeout).
     :return: The OAuth access token as a string.
     """
     if client_id is None:
@@ -35,13 +39,38 @@ def get_databricks_token(
         f"{host}/oidc/v1/token",
         auth=HTTPBasicAuth(client_id, client_secret),
         data={"grant_type": grant_type, "scope": scope},
+        timeout=timeout,
     )
     response.raise_for_status()  # Raises an error for bad responses
     return response.json()["access_token"]
 
 
+def make_token_provider(host: str, ttl: float = 1800.0) -> Callable[..., str]:
+    """Create a callable that returns a Databricks OAuth token, fetching a new one only after `ttl` seconds.
+
+    The returned callable takes an optional `timeout` in seconds that bounds a token refresh.
+
+    :param host: The Databricks workspace host URL.
+    :param ttl: Number of seconds a fetched token is reused, kept below the token lifetime of one hour.
+    :return: A callable returning a valid OAuth access token.
+    """
+    cache: dict[str, Any] = {"token": None, "expires_at": 0.0}
+
+    def token_provider(timeout: float | None = None) -> str:
+        if cache["token"] is None or time.monotonic() >= cache["expires_at"]:
+            cache["token"] = get_databricks_token(host=host, timeout=timeout)
+            cache["expires_at"] = time.monotonic() + ttl
+        return cache["token"]
+
+    return token_provider
+
+
 def call_serving_endpoint(
-    serving_endpoint: str, token: str, input_df: pd.DataFrame, data_key: str = "dataframe_split"
+    serving_endpoint: str,
+    token: str,
+    input_df: pd.DataFrame,
+    data_key: str = "dataframe_split",
+    timeout: float | None = None,
 ) -> dict[str, Any]:
     """Call a model serving endpoint with a DataFrame payload and returns the JSON response.
 
@@ -51,10 +80,11 @@ def call_serving_endpoint(
     :param token: Bearer token for authentication.
     :param input_df: Input DataFrame to send as JSON.
     :param data_key: Key for the JSON payload (default: 'dataframe_split').
+    :param timeout: Seconds to wait for the endpoint before giving up (default: no timeout).
     :return: The JSON response from the endpoint.
     """
     headers = {"Authorization": f"Bearer {token}"}
     payload = {data_key: input_df.to_dict(orient="split")}
-    response = requests.post(serving_endpoint, headers=headers, json=payload)
+    response = requests.post(serving_endpoint, headers=headers, json=payload, timeout=timeout)
     response.raise_for_status()  # Raises an HTTPError for bad responses
     return response.json()
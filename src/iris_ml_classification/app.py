@@ -6,13 +6,41 @@ import requests
 import streamlit as st
 
 if os.getenv("DATABRICKS_WORKSPACE_ID", None):
-    from api import call_serving_endpoint, get_databricks_token
+    from api import call_serving_endpoint, get_databricks_token, make_token_provider
     from config import config
     from ui import display_result, inject_css, input_form, set_page, show_footer
+    from warmer import EndpointWarmer
 else:
-    from iris_ml_classification.api import call_serving_endpoint, get_databricks_token
+    from iris_ml_classification.api import call_serving_endpoint, get_databricks_token, make_token_provider
     from iris_ml_classification.config import config
     from iris_ml_classification.ui import display_result, inject_css, input_form, set_page, show_footer
+    from iris_ml_classification.warmer import EndpointWarmer
+
+
+@st.cache_resource
+def start_endpoint_warmer() -> EndpointWarmer | None:
+    """Start the background endpoint warmer once per app process, if enabled in the configuration.
+
+    Warm-up pings reuse a cached OAuth token, so a ping is a single call to the serving endpoint. A failed token
+    refresh fails the ping; the warmer logs the error, whose message names the token URL.
+
+    :return: The running endpoint warmer, or None if the warmer is disabled.
+    """
+    if not config.WARMER_ENABLED:
+        return None
+    token_provider = make_token_provider(host=config.HOST)
+    warmer = EndpointWarmer(
+        predict=lambda df, timeout: call_serving_endpoint(
+            serving_endpoint=config.SERVING_ENDPOINT,
+            token=token_provider(timeout=timeout),
+            input_df=df,
+            timeout=timeout,
+        ),
+        interval=config.WARMER_INTERVAL,
+        min_interval=min(30.0, config.WARMER_INTERVAL),
+    )
+    warmer.start()
+    return warmer
 
 
 def main() -> None:
@@ -20,12 +48,15 @@ def main() -> None:
 
     This function handles CSS injection, user input, prediction requests, and result display.
     """
+    warmer = start_endpoint_warmer()
     inject_css()
     input_df = input_form()
     if st.button("🔮 Predict Species"):
         try:
             token = get_databricks_token(host=config.HOST)
             response = call_serving_endpoint(serving_endpoint=config.SERVING_ENDPOINT, token=token, input_df=input_df)
+            if warmer is not None:
+                warmer.record_traffic()
             predicted_species = response["predictions"][0]
             display_result(predicted_species)
         except requests.exceptions.HTTPError as e:
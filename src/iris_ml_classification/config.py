@@ -1,7 +1,7 @@
 """Configuration utilities for serving endpoint settings.
 
 This module defines the `Config` class, which loads environment variables and constructs
-the serving endpoint URL for the Iris ML Classification service.
+the serving endpoint URL and endpoint warmer settings for the Iris ML Classification service.
 
 Classes:
     Config: Loads environment variables and constructs endpoint URLs.
@@ -11,8 +11,28 @@ Attributes:
 
 """
 
+import math
 import os
 
+from loguru import logger
+
+
+def _read_warmer_interval() -> float | None:
+    """Read the endpoint warmer interval in seconds, or return None if the warmer is disabled or misconfigured."""
+    if os.getenv("ENDPOINT_WARMER_ENABLED", "false").lower() != "true":
+        return None
+    value = os.getenv("ENDPOINT_WARMER_INTERVAL", "300")
+    try:
+        interval = float(value)
+    except ValueError:
+        interval = math.nan
+    if math.isfinite(interval) and interval > 0:
+        return interval
+    logger.warning(
+        f"Invalid ENDPOINT_WARMER_INTERVAL={value!r}, expected a positive number of seconds; warmer disabled."
+    )
+    return None
+
 
 class Config:
     """Configuration class for serving endpoint settings.
@@ -25,6 +45,8 @@ class Config:
     HOST = os.getenv("DATABRICKS_HOST", "")
     HOST = HOST if HOST.startswith("https://") else f"https://{HOST}"
     SERVING_ENDPOINT = f"{HOST}/serving-endpoints/{ENDPOINT_NAME}/invocations"
+    WARMER_INTERVAL = _read_warmer_interval()
+    WARMER_ENABLED = WARMER_INTERVAL is not None
 
 
 config = Config()
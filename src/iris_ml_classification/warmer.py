@@ -0,0 +1,157 @@
+"""warmer module."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+import requests
+from loguru import logger
+
+# A cheap, well-formed iris row used to keep the serving endpoint warm.
+WARMUP_ROW = pd.DataFrame(
+    [[5.1, 3.5, 1.4, 0.2]],
+    columns=["sepal length (cm)", "sepal width (cm)", "petal length (cm)", "petal width (cm)"],
+)
+
+
+def _is_cold_failure(error: Exception) -> bool:
+    """Whether a failed request looks like a scaled-to-zero endpoint rather than a broken request."""
+    if isinstance(error, requests.exceptions.Timeout | requests.exceptions.ConnectionError):
+        return True
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.exceptions.HTTPError) and response is not None and response.status_code >= 500
+
+
+class EndpointWarmer:
+    """Background warmer that keeps a scale-to-zero serving endpoint from going cold.
+
+    The schedule follows real traffic: after each real request, recorded with `record_traffic`, the next check is
+    deferred until one keep-warm interval has passed without traffic, and only then is a synthetic iris row sent.
+    The length of the interval adapts to the warmer's own pings: a cold observation (a slow ping, a timeout, a
+    connection error or a 5xx response) halves it, down to `min_interval`, and fast responses let it grow back
+    towards `interval`.
+
+    While real traffic keeps the endpoint warm the warmer sends no pings, and it resumes as soon as traffic has been
+    quiet for a full interval, so the endpoint stays covered after a busy stretch ends.
+
+    :param predict: Callable that sends a DataFrame to the serving endpoint with a request timeout in seconds.
+    :param interval: Longest time in seconds the endpoint may go without a request.
+    :param min_interval: Shortest keep-warm interval in seconds the warmer adapts down to.
+    :param cold_start_threshold: Latency in seconds at or above which a response counts as a cold start.
+    :param request_timeout: Seconds each request of a warm-up ping may take before it is abandoned.
+    :param history_size: Number of most recent cold-start latencies to keep.
+    :param clock: Monotonic clock returning seconds, replaceable for testing.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[pd.DataFrame, float], Any],
+        interval: float = 300.0,
+        min_interval: float = 30.0,
+        cold_start_threshold: float = 2.0,
+        request_timeout: float = 60.0,
+        history_size: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < min_interval <= interval:
+            raise ValueError("Expected 0 < min_interval <= interval.")
+        self.predict = predict
+        self.max_interval = interval
+        self.min_interval = min_interval
+        self.cold_start_threshold = cold_start_threshold
+        self.request_timeout = request_timeout
+        self.clock = clock
+        self.interval = interval
+        self._cold_starts: deque[float] = deque(maxlen=history_size)
+        self._last_traffic: float | None = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def cold_starts(self) -> list[float]:
+        """Latencies in seconds of the cold observations made by the warmer, oldest first."""
+        with self._lock:
+            return list(self._cold_starts)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background warmer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background warmer thread; does nothing if it is already running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="endpoint-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background warmer thread and wait for it to exit.
+
+        Each request a ping makes is bounded by `request_timeout`, so a ping that also refreshes its token can take up
+        to twice that long before the thread exits.
+
+        :param timeout: Maximum time in seconds to wait for the thread to exit.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def record_traffic(self) -> None:
+        """Record that a real request has just reached the serving endpoint."""
+        with self._lock:
+            self._last_traffic = self.clock()
+
+    def warm(self) -> float | None:
+        """Send the synthetic row to the endpoint and adapt the keep-warm interval to the outcome.
+
+        A slow ping, a timeout, a connection error or a 5xx response is treated as a cold observation: its elapsed
+        time is recorded and the interval shrinks. Any other failure, such as a 4xx response or a missing credential,
+        is only logged.
+
+        :return: The request latency in seconds, or None if the request failed.
+        """
+        started = self.clock()
+        try:
+            self.predict(WARMUP_ROW, self.request_timeout)
+        except Exception as e:
+            elapsed = self.clock() - started
+            logger.warning(f"Endpoint warm-up ping failed after {elapsed:.2f}s: {e}")
+            if _is_cold_failure(e):
+                self._observe(elapsed, cold=True)
+            return None
+        latency = self.clock() - started
+        self._observe(latency, cold=latency >= self.cold_start_threshold)
+        return latency
+
+    def step(self) -> float:
+        """Run a single warmer check, pinging the endpoint unless real traffic has kept it warm.
+
+        :return: Seconds to wait before the next check.
+        """
+        with self._lock:
+            last_traffic = self._last_traffic
+        idle = None if last_traffic is None else self.clock() - last_traffic
+        if idle is not None and idle < self.interval:
+            return self.interval - idle
+        self.warm()
+        return self.interval
+
+    def _observe(self, latency: float, cold: bool) -> None:
+        """Record a ping outcome and halve or grow the keep-warm interval accordingly."""
+        with self._lock:
+            if cold:
+                self._cold_starts.append(latency)
+                self.interval = max(self.min_interval, self.interval / 2)
+            else:
+                self.interval = min(self.max_interval, self.interval * 1.5)
+
+    def _run(self) -> None:
+        """Run warmer checks until stopped."""
+        while not self._stop_event.is_set():
+            self._stop_event.wait(self.step())
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 from unittest.mock import patch
-from src.iris_ml_classification.api import get_databricks_token, call_serving_endpoint
+from src.iris_ml_classification.api import get_databricks_token, call_serving_endpoint, make_token_provider
 
 
 # ---------- Tests for get_databricks_token ----------
@@ -21,6 +21,7 @@ def test_get_databricks_token_success(mock_post):
     assert token == "mocked_token"
     mock_post.assert_called_once()
     assert mock_post.call_args[1]["auth"].username == "test_client_id"
+    assert mock_post.call_args[1]["timeout"] is None
 
 
 @patch.dict("os.environ", {
@@ -46,6 +47,26 @@ def test_get_databricks_token_failure(mock_post):
         get_databricks_token("https://test-host", "id", "secret")
 
 
+# ---------- Tests for make_token_provider ----------
+
+@patch("src.iris_ml_classification.api.get_databricks_token", side_effect=["token_1", "token_2"])
+def test_make_token_provider_reuses_token_within_ttl(mock_token):
+    token_provider = make_token_provider(host="https://test-host", ttl=100)
+
+    assert token_provider() == "token_1"
+    assert token_provider() == "token_1"
+    mock_token.assert_called_once_with(host="https://test-host", timeout=None)
+
+
+@patch("src.iris_ml_classification.api.get_databricks_token", side_effect=["token_1", "token_2"])
+def test_make_token_provider_refreshes_after_ttl(mock_token):
+    token_provider = make_token_provider(host="https://test-host", ttl=0)
+
+    assert token_provider() == "token_1"
+    assert token_provider(timeout=5) == "token_2"
+    assert mock_token.call_args[1]["timeout"] == 5
+
+
 # ---------- Tests for call_serving_endpoint ----------
 
 @patch("src.iris_ml_classification.api.requests.post")
@@ -61,6 +82,16 @@ def test_call_serving_endpoint_success(mock_post):
     assert result == {"predictions": ["setosa"]}
     mock_post.assert_called_once()
     assert mock_post.call_args[1]["headers"]["Authorization"] == "Bearer fake_token"
+    assert mock_post.call_args[1]["timeout"] is None
+
+
+@patch("src.iris_ml_classification.api.requests.post")
+def test_call_serving_endpoint_timeout(mock_post):
+    df = pd.DataFrame([[1, 2, 3, 4]], columns=["a", "b", "c", "d"])
+
+    call_serving_endpoint("https://endpoint", "fake_token", df, timeout=5)
+
+    assert mock_post.call_args[1]["timeout"] == 5
 
 
 @patch("src.iris_ml_classification.api.requests.post")
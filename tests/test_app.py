@@ -1,5 +1,13 @@
+import pytest
 from unittest.mock import patch, MagicMock
-from src.iris_ml_classification.app import main
+from src.iris_ml_classification.app import main, start_endpoint_warmer
+
+
+@pytest.fixture
+def clear_warmer_cache():
+    start_endpoint_warmer.clear()
+    yield
+    start_endpoint_warmer.clear()
 
 @patch("src.iris_ml_classification.app.display_result")
 @patch("src.iris_ml_classification.app.st")
@@ -39,3 +47,43 @@ def test_main_unexpected_exception(mock_footer, mock_css, mock_form, mock_token,
     main()
 
     mock_st.error.assert_called_with("Unexpected error: Something failed")
+
+
+@patch("src.iris_ml_classification.app.display_result")
+@patch("src.iris_ml_classification.app.st")
+@patch("src.iris_ml_classification.app.call_serving_endpoint", return_value={"predictions": ["setosa"]})
+@patch("src.iris_ml_classification.app.get_databricks_token", return_value="token")
+@patch("src.iris_ml_classification.app.input_form")
+@patch("src.iris_ml_classification.app.inject_css")
+@patch("src.iris_ml_classification.app.show_footer")
+@patch("src.iris_ml_classification.app.start_endpoint_warmer")
+def test_main_records_traffic_on_warmer(mock_warmer, mock_footer, mock_css, mock_form, mock_token, mock_call, mock_st, mock_display_result):
+    mock_st.button.return_value = True
+    mock_form.return_value = MagicMock()
+
+    main()
+
+    mock_warmer.assert_called_once()
+    mock_warmer.return_value.record_traffic.assert_called_once()
+
+
+@patch("src.iris_ml_classification.app.EndpointWarmer")
+@patch("src.iris_ml_classification.app.config")
+def test_start_endpoint_warmer_clamps_min_interval(mock_config, mock_warmer, clear_warmer_cache):
+    mock_config.WARMER_ENABLED = True
+    mock_config.WARMER_INTERVAL = 10.0
+
+    warmer = start_endpoint_warmer()
+
+    assert warmer is mock_warmer.return_value
+    assert mock_warmer.call_args[1]["min_interval"] == 10.0
+    warmer.start.assert_called_once()
+
+
+@patch("src.iris_ml_classification.app.EndpointWarmer")
+@patch("src.iris_ml_classification.app.config")
+def test_start_endpoint_warmer_disabled(mock_config, mock_warmer, clear_warmer_cache):
+    mock_config.WARMER_ENABLED = False
+
+    assert start_endpoint_warmer() is None
+    mock_warmer.assert_not_called()
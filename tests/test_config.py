@@ -0,0 +1,42 @@
+import importlib
+
+import pytest
+from loguru import logger
+from unittest.mock import patch
+import src.iris_ml_classification.config as config_module
+
+
+@pytest.fixture
+def reload_config():
+    yield lambda: importlib.reload(config_module).Config
+    importlib.reload(config_module)
+
+
+@patch.dict("os.environ", {"ENDPOINT_WARMER_ENABLED": "true", "ENDPOINT_WARMER_INTERVAL": "10"})
+def test_warmer_config_valid(reload_config):
+    config = reload_config()
+
+    assert config.WARMER_ENABLED
+    assert config.WARMER_INTERVAL == 10
+
+
+@pytest.mark.parametrize("interval", ["abc", "0", "-5", "nan", "inf"])
+def test_warmer_config_invalid_interval_disables_warmer(reload_config, interval):
+    with patch.dict("os.environ", {"ENDPOINT_WARMER_ENABLED": "true", "ENDPOINT_WARMER_INTERVAL": interval}):
+        config = reload_config()
+
+    assert not config.WARMER_ENABLED
+    assert config.WARMER_INTERVAL is None
+
+
+@patch.dict("os.environ", {"ENDPOINT_WARMER_ENABLED": "false", "ENDPOINT_WARMER_INTERVAL": "abc"})
+def test_warmer_config_not_validated_when_disabled(reload_config):
+    messages = []
+    handler_id = logger.add(messages.append)
+    try:
+        config = reload_config()
+    finally:
+        logger.remove(handler_id)
+
+    assert not config.WARMER_ENABLED
+    assert messages == []
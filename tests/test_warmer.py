@@ -0,0 +1,207 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from unittest.mock import MagicMock
+from src.iris_ml_classification.api import call_serving_endpoint
+from src.iris_ml_classification.warmer import EndpointWarmer
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def slow_predict(clock, latency):
+    """Build a predict callable whose response takes `latency` seconds on the fake clock."""
+    return MagicMock(side_effect=lambda df, timeout: clock.advance(latency))
+
+
+# ---------- Tests for EndpointWarmer.warm ----------
+
+def test_warm_records_cold_start_and_shrinks_interval(clock):
+    warmer = EndpointWarmer(slow_predict(clock, 5.0), interval=60, min_interval=10, cold_start_threshold=2, clock=clock)
+
+    latency = warmer.warm()
+
+    assert latency == 5.0
+    assert warmer.cold_starts == [5.0]
+    assert warmer.interval == 30
+
+
+def test_warm_fast_response_grows_interval_up_to_max(clock):
+    predict = slow_predict(clock, 5.0)
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, cold_start_threshold=2, clock=clock)
+    warmer.warm()
+    predict.side_effect = lambda df, timeout: clock.advance(0.1)
+
+    warmer.warm()
+    warmer.warm()
+
+    assert warmer.cold_starts == [5.0]
+    assert warmer.interval == 60
+
+
+def test_warm_passes_request_timeout(clock):
+    predict = slow_predict(clock, 0.1)
+    warmer = EndpointWarmer(predict, request_timeout=7, clock=clock)
+
+    warmer.warm()
+
+    assert predict.call_args[0][1] == 7
+
+
+def test_warm_timeout_counts_as_cold_start(clock):
+    def predict(df, timeout):
+        clock.advance(timeout)
+        raise requests.exceptions.Timeout("Read timed out")
+
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, request_timeout=15, clock=clock)
+
+    assert warmer.warm() is None
+    assert warmer.cold_starts == [15]
+    assert warmer.interval == 30
+
+
+def test_warm_5xx_counts_as_cold_start(clock):
+    response = MagicMock(status_code=503)
+    predict = MagicMock(side_effect=requests.exceptions.HTTPError("503 Service Unavailable", response=response))
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, clock=clock)
+
+    assert warmer.warm() is None
+    assert warmer.cold_starts == [0.0]
+    assert warmer.interval == 30
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.exceptions.HTTPError("403 Forbidden", response=MagicMock(status_code=403)),
+        KeyError("DATABRICKS_CLIENT_ID"),
+    ],
+)
+def test_warm_broken_request_is_not_a_cold_start(clock, error):
+    warmer = EndpointWarmer(MagicMock(side_effect=error), interval=60, min_interval=10, clock=clock)
+
+    assert warmer.warm() is None
+    assert warmer.cold_starts == []
+    assert warmer.interval == 60
+
+
+# ---------- Tests for EndpointWarmer.step ----------
+
+def test_step_pings_when_idle(clock):
+    predict = slow_predict(clock, 0.1)
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, clock=clock)
+
+    assert warmer.step() == 60
+    predict.assert_called_once()
+
+
+def test_step_defers_ping_after_real_traffic(clock):
+    predict = slow_predict(clock, 0.1)
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, clock=clock)
+    warmer.record_traffic()
+    clock.advance(20)
+
+    delay = warmer.step()
+
+    predict.assert_not_called()
+    assert delay == 40
+
+
+def test_step_skips_pings_under_traffic_and_resumes_when_traffic_stops(clock):
+    predict = slow_predict(clock, 0.1)
+    warmer = EndpointWarmer(predict, interval=60, min_interval=10, clock=clock)
+    for _ in range(5):
+        warmer.record_traffic()
+        clock.advance(warmer.step())
+    predict.assert_not_called()
+
+    warmer.step()
+
+    predict.assert_called_once()
+
+
+def test_invalid_intervals():
+    with pytest.raises(ValueError):
+        EndpointWarmer(MagicMock(), interval=1.0, min_interval=2.0)
+
+
+# ---------- End-to-end test against a local stand-in server ----------
+
+class ColdStartServer:
+    """Serve predictions locally, sleeping `cold_delay` when no request arrived within `idle_timeout`."""
+
+    def __init__(self, cold_delay=0.5, idle_timeout=5.0):
+        self.cold_delay = cold_delay
+        self.idle_timeout = idle_timeout
+        self.last_request = None
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                now = time.monotonic()
+                if server.last_request is None or now - server.last_request > server.idle_timeout:
+                    time.sleep(server.cold_delay)
+                server.last_request = time.monotonic()
+                server.requests += 1
+                body = json.dumps({"predictions": ["setosa"]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/invocations"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def predict(self, df, timeout):
+        return call_serving_endpoint(self.url, "fake_token", df, timeout=timeout)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = ColdStartServer()
+    yield server
+    server.close()
+
+
+def test_background_warmer_against_cold_start_server(server):
+    warmer = EndpointWarmer(server.predict, interval=0.1, min_interval=0.05, cold_start_threshold=0.4)
+
+    warmer.start()
+    deadline = time.monotonic() + 10
+    while server.requests < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    warmer.stop(timeout=10)
+
+    assert not warmer.is_running
+    assert server.requests >= 2
+    assert warmer.cold_starts and warmer.cold_starts[0] >= 0.4